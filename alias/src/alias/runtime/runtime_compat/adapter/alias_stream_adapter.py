@@ -1,50 +1,118 @@
 # -*- coding: utf-8 -*-
-import json
+import functools
 from typing import Any, AsyncIterator, Dict, Optional, Union
 
 from agentscope_runtime.engine.helpers.agent_api_builder import ResponseBuilder
 from agentscope_runtime.engine.schemas.agent_schemas import (
     Content,
     ContentType,
-    FunctionCall,
-    FunctionCallOutput,
     Message,
     MessageType,
     Role,
 )
 
+from alias.server.utils.json_utils import json_dumps, json_loads
+
+_format_file_link = "📁 [{0}]({1})".format
+
+_NOT_JSON = object()
+
+_PARSEABLE_TYPES = (str, list, dict)
+
+# Only short payloads are memoized so the cache cannot pin large tool outputs.
+_PARSE_CACHE_MAX_LEN = 4096
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_json_cached(content: str) -> Any:
+    try:
+        return json_loads(content)
+    except Exception:
+        return _NOT_JSON
+
+
+def _load_json_or_sentinel(content: str) -> Any:
+    if len(content) <= _PARSE_CACHE_MAX_LEN:
+        return _load_json_cached(content)
+    try:
+        return json_loads(content)
+    except Exception:
+        return _NOT_JSON
+
+
+def _may_hold_json(val: str) -> bool:
+    """
+    Cheap pre-check: whether `val` could be a (padded) JSON object/array.
+    """
+    return bool(val) and (val[0] in "{[" or val[0].isspace())
+
+
+def _parse_json_string(val: str) -> Any:
+    """
+    Parse `val` if it holds a JSON object or array, else return it as is.
+    """
+    # Most leaves are plain text; reject them without building a
+    # stripped copy.
+    if not _may_hold_json(val):
+        return val
+    content = val
+    if val[0].isspace() or val[-1].isspace():
+        content = val.strip()
+    if content[:1] + content[-1:] not in ("{}", "[]"):
+        return val
+    parsed = _load_json_or_sentinel(content)
+    # If nested JSON parsing fails, treat it as a normal string.
+    return val if parsed is _NOT_JSON else parsed
+
 
 def _try_deep_parse(val: Any) -> Any:
     """
     Recursively parse JSON-like strings into native Python objects.
     """
     if isinstance(val, str):
-        content = val.strip()
-        if (content.startswith("{") and content.endswith("}")) or (
-            content.startswith("[") and content.endswith("]")
-        ):
-            try:
-                parsed = json.loads(content)
-                return _try_deep_parse(parsed)
-            except Exception:
-                # If nested JSON parsing fails, treat it as a normal string.
-                return val
-        return val
+        parsed = _parse_json_string(val)
+        # Recursing rebuilds every container, so the cached object is
+        # never handed out or mutated.
+        return val if parsed is val else _try_deep_parse(parsed)
+    # Scalar leaves are copied inline instead of paying for a call frame.
     if isinstance(val, list):
-        return [_try_deep_parse(i) for i in val]
+        return [
+            _try_deep_parse(i) if isinstance(i, _PARSEABLE_TYPES) else i
+            for i in val
+        ]
     if isinstance(val, dict):
-        return {k: _try_deep_parse(v) for k, v in val.items()}
+        return {
+            k: _try_deep_parse(v) if isinstance(v, _PARSEABLE_TYPES) else v
+            for k, v in val.items()
+        }
     return val
 
 
+def _has_parseable_values(val: Dict[Any, Any]) -> bool:
+    """
+    Whether `_try_deep_parse` could change any value of a flat dict.
+    """
+    for v in val.values():
+        if isinstance(v, str):
+            if _may_hold_json(v):
+                return True
+        elif isinstance(v, (list, dict)):
+            return True
+    return False
+
+
 def _ensure_safe_json_string(val: Any) -> str:
     """
     Serialize content into a valid JSON string suitable for WebUI parsing.
     """
+    # Typical tool arguments are a flat dict of plain values: nothing to
+    # deep-parse, so serialize them as they are.
+    if isinstance(val, dict) and not _has_parseable_values(val):
+        return json_dumps(val)
     parsed_val = _try_deep_parse(val)
     if parsed_val is None:
         return "{}"
-    return json.dumps(parsed_val, ensure_ascii=False)
+    return json_dumps(parsed_val)
 
 
 def _extract_alias_output_obj(content_str: str) -> Any:
@@ -52,7 +120,7 @@ def _extract_alias_output_obj(content_str: str) -> Any:
     Extract the `output` object from Alias nested tool-result content.
     """
     try:
-        data = json.loads(content_str)
+        data = json_loads(content_str)
         if isinstance(data, list) and data:
             return data[0].get("output")
     except Exception:
@@ -64,6 +132,14 @@ def _extract_alias_output_obj(content_str: str) -> Any:
 
 
 class AliasAdapterState:
+    __slots__ = (
+        "mb",
+        "cb",
+        "runtime_type",
+        "last_content",
+        "is_completed",
+    )
+
     def __init__(
         self,
         message_builder: Any,
@@ -85,6 +161,16 @@ async def adapt_alias_message_stream(
     state_map: Dict[str, AliasAdapterState] = {}
     last_active_key: Optional[str] = None
 
+    # Bound once: the loop below runs for every streamed token.
+    reasoning = MessageType.REASONING
+    plugin_call = MessageType.PLUGIN_CALL
+    plugin_call_output = MessageType.PLUGIN_CALL_OUTPUT
+    message = MessageType.MESSAGE
+    role_assistant = Role.ASSISTANT
+    role_tool = Role.TOOL
+    content_data = ContentType.DATA
+    content_text = ContentType.TEXT
+
     yield rb.created()
     yield rb.in_progress()
 
@@ -101,18 +187,18 @@ async def adapt_alias_message_stream(
             alias_status = inner_msg.get("status")
             tool_call_id = inner_msg.get("tool_call_id") or alias_id
 
-            if alias_type in ["thought", "sub_thought"]:
-                runtime_type = MessageType.REASONING
-                target_role = Role.ASSISTANT
-            elif alias_type in ["tool_call", "tool_use"]:
-                runtime_type = MessageType.PLUGIN_CALL
-                target_role = Role.ASSISTANT
+            if alias_type in {"thought", "sub_thought"}:
+                runtime_type = reasoning
+                target_role = role_assistant
+            elif alias_type in {"tool_call", "tool_use"}:
+                runtime_type = plugin_call
+                target_role = role_assistant
             elif alias_type == "tool_result":
-                runtime_type = MessageType.PLUGIN_CALL_OUTPUT
-                target_role = Role.TOOL
+                runtime_type = plugin_call_output
+                target_role = role_tool
             else:
-                runtime_type = MessageType.MESSAGE
-                target_role = Role.ASSISTANT
+                runtime_type = message
+                target_role = role_assistant
 
             state_key = f"{tool_call_id}_{runtime_type}"
 
@@ -125,63 +211,64 @@ async def adapt_alias_message_stream(
 
             last_active_key = state_key
 
-            if state_key not in state_map:
-                mb = rb.create_message_builder(role=target_role)
-                mb.message.type = runtime_type
+            state = state_map.get(state_key)
+            if state is None:
+                mb = rb.create_message_builder(
+                    role=target_role,
+                    message_type=runtime_type,
+                )
                 yield mb.get_message_data()
 
-                if runtime_type in [
-                    MessageType.PLUGIN_CALL,
-                    MessageType.PLUGIN_CALL_OUTPUT,
-                ]:
-                    c_type = ContentType.DATA
+                if runtime_type in (plugin_call, plugin_call_output):
+                    c_type = content_data
                 else:
-                    c_type = ContentType.TEXT
+                    c_type = content_text
 
                 cb = mb.create_content_builder(content_type=c_type)
-                state_map[state_key] = AliasAdapterState(mb, cb, runtime_type)
-
-            state = state_map[state_key]
+                state = AliasAdapterState(mb, cb, runtime_type)
+                state_map[state_key] = state
 
-            if runtime_type in [MessageType.MESSAGE, MessageType.REASONING]:
+            if runtime_type in (message, reasoning):
                 raw_text = str(inner_msg.get("content") or "")
 
                 if alias_type == "files" and "files" in inner_msg:
                     raw_text = "\n".join(
-                        [
-                            f"📁 [{f['filename']}]({f['url']})"
-                            for f in inner_msg["files"]
-                        ],
+                        _format_file_link(f["filename"], f["url"])
+                        for f in inner_msg["files"]
                     )
 
                 if raw_text.startswith(state.last_content):
                     delta = raw_text[len(state.last_content) :]
                     if delta:
                         yield state.cb.add_text_delta(delta)
-                    state.last_content = raw_text
                 else:
                     yield state.cb.set_text(raw_text)
-                    state.last_content = raw_text
+                state.last_content = raw_text
 
-            elif runtime_type == MessageType.PLUGIN_CALL:
+            elif runtime_type == plugin_call:
                 args = inner_msg.get("arguments") or {}
-                fc = FunctionCall(
-                    call_id=tool_call_id,
-                    name=inner_msg.get("tool_name") or "tool",
-                    arguments=_ensure_safe_json_string(args),
+                # Same shape as `FunctionCall(...).model_dump()`, built
+                # directly to skip pydantic on every tool-call chunk.
+                yield state.cb.set_data(
+                    {
+                        "call_id": tool_call_id,
+                        "name": inner_msg.get("tool_name") or "tool",
+                        "arguments": _ensure_safe_json_string(args),
+                    },
                 )
-                yield state.cb.set_data(fc.model_dump())
 
-            elif runtime_type == MessageType.PLUGIN_CALL_OUTPUT:
+            elif runtime_type == plugin_call_output:
                 output_obj = _extract_alias_output_obj(
                     inner_msg.get("content", ""),
                 )
-                fco = FunctionCallOutput(
-                    call_id=tool_call_id,
-                    name=inner_msg.get("tool_name") or "tool",
-                    output=_ensure_safe_json_string(output_obj),
+                # Same shape as `FunctionCallOutput(...).model_dump()`.
+                yield state.cb.set_data(
+                    {
+                        "call_id": tool_call_id,
+                        "name": inner_msg.get("tool_name") or "tool",
+                        "output": _ensure_safe_json_string(output_obj),
+                    },
                 )
-                yield state.cb.set_data(fco.model_dump())
 
             if alias_status == "finished" and not state.is_completed:
                 yield state.cb.complete()
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import secrets
 import uuid
+from collections import OrderedDict
 from typing import Any, AsyncGenerator, Dict, Optional, Union
 
 from fastapi_limiter import FastAPILimiter
@@ -28,7 +31,7 @@ from alias.server.exceptions.base import BaseError
 from alias.runtime.runtime_compat.adapter.alias_stream_adapter import (
     adapt_alias_message_stream,
 )
-from alias.server.schemas.chat import ChatRequest
+from alias.server.schemas.chat import ChatMode, ChatRequest
 from alias.server.services.chat_service import ChatService
 from alias.server.services.conversation_service import ConversationService
 from alias.server.utils.logger import setup_logger
@@ -37,6 +40,8 @@ from alias.server.utils.redis import redis_client
 
 class AliasRunner(Runner):
     FRAMEWORK_TYPE = "Alias"
+    # Least recently used sessions are forgotten beyond this many.
+    MAX_CACHED_SESSIONS = 10_000
 
     def __init__(
         self,
@@ -48,7 +53,9 @@ class AliasRunner(Runner):
         self.default_chat_mode = default_chat_mode
         self.default_conv_name = default_conv_name
 
-        self._session_conv_cache: Dict[str, uuid.UUID] = {}
+        self._chat_service = ChatService()
+
+        self._session_conv_cache: "OrderedDict[str, uuid.UUID]" = OrderedDict()
 
     async def stop(self) -> None:
         if not getattr(self, "_health", False):
@@ -61,8 +68,7 @@ class AliasRunner(Runner):
         chat_request: ChatRequest = kwargs["chat_request"]
         task_id: uuid.UUID = kwargs.get("task_id") or uuid.uuid4()
 
-        service = ChatService()
-        response_gen = await service.chat(
+        response_gen = await self._chat_service.chat(
             user_id=user_id,
             conversation_id=conversation_id,
             chat_request=chat_request,
@@ -92,23 +98,34 @@ class AliasRunner(Runner):
         print("Alias shutdown complete.")
 
     @staticmethod
-    def _extract_text_from_agent_request(req_dict: Dict[str, Any]) -> str:
-        agent_input = req_dict.get("input")
+    def _field(obj: Any, name: str) -> Any:
+        """Read `name` from a plain dict or a pydantic model alike."""
+        if isinstance(obj, dict):
+            return obj.get(name)
+        return getattr(obj, name, None)
+
+    @classmethod
+    def _extract_text_from_agent_request(
+        cls,
+        request: Union[AgentRequest, Dict[str, Any]],
+    ) -> str:
+        field = cls._field
+        agent_input = field(request, "input")
         if isinstance(agent_input, str):
             return agent_input
 
         if isinstance(agent_input, list) and agent_input:
             last = agent_input[-1]
-            if isinstance(last, dict):
-                content = last.get("content")
-                if isinstance(content, str):
-                    return content
-                if isinstance(content, list):
-                    for blk in reversed(content):
-                        if isinstance(blk, dict) and blk.get("type") == "text":
-                            return blk.get("text") or ""
-                if "text" in last and isinstance(last["text"], str):
-                    return last["text"]
+            content = field(last, "content")
+            if isinstance(content, str):
+                return content
+            if isinstance(content, list):
+                for blk in reversed(content):
+                    if field(blk, "type") == "text":
+                        return field(blk, "text") or ""
+            text = field(last, "text")
+            if isinstance(text, str):
+                return text
         return ""
 
     @staticmethod
@@ -123,6 +140,7 @@ class AliasRunner(Runner):
             return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _stable_uuid_from_string(s: str) -> uuid.UUID:
         return uuid.uuid5(uuid.NAMESPACE_DNS, f"alias::{s}")
 
@@ -131,8 +149,10 @@ class AliasRunner(Runner):
         session_id: str,
         user_uuid: uuid.UUID,
     ) -> uuid.UUID:
-        if session_id in self._session_conv_cache:
-            return self._session_conv_cache[session_id]
+        cached = self._session_conv_cache.get(session_id)
+        if cached is not None:
+            self._session_conv_cache.move_to_end(session_id)
+            return cached
 
         async with session_scope() as session:
             service = ConversationService(session=session)
@@ -157,11 +177,14 @@ class AliasRunner(Runner):
             )
 
         self._session_conv_cache[session_id] = conv_id
+        if len(self._session_conv_cache) > self.MAX_CACHED_SESSIONS:
+            self._session_conv_cache.popitem(last=False)
         return conv_id
 
     async def stream_query_native(
         self,
-        request: Union[AgentRequest, dict],
+        request: Union[ChatRequest, AgentRequest, dict],
+        pre_validated: bool = False,
         **kwargs: Any,
     ) -> AsyncGenerator[Any, None]:
         if not self._health:
@@ -171,18 +194,16 @@ class AliasRunner(Runner):
                 "before calling 'stream_query'.",
             )
 
-        req_dict = (
-            request if isinstance(request, dict) else request.model_dump()
-        )
+        field = self._field
         user_id = kwargs.get("user_id") or self._to_uuid(
-            req_dict.get("user_id"),
+            field(request, "user_id"),
         )
         conversation_id = kwargs.get("conversation_id") or self._to_uuid(
-            req_dict.get("conversation_id"),
+            field(request, "conversation_id"),
         )
         task_id = (
             kwargs.get("task_id")
-            or self._to_uuid(req_dict.get("task_id"))
+            or self._to_uuid(field(request, "task_id"))
             or uuid.uuid4()
         )
 
@@ -198,7 +219,16 @@ class AliasRunner(Runner):
             return
 
         try:
-            chat_request_obj = ChatRequest.model_validate(req_dict)
+            # `pre_validated` ChatRequest instances (e.g. from the FastAPI
+            # chat endpoint) are already validated, so they are used as is.
+            if pre_validated and isinstance(request, ChatRequest):
+                chat_request_obj = request
+            elif isinstance(request, (dict, ChatRequest)):
+                chat_request_obj = ChatRequest.model_validate(request)
+            else:
+                chat_request_obj = ChatRequest.model_validate(
+                    request.model_dump(),
+                )
         except ValidationError as exc:
             yield {
                 "error": "invalid_request",
@@ -243,7 +273,7 @@ class AliasRunner(Runner):
 
     async def stream_query(
         self,
-        request: Union[AgentRequest, dict],
+        request: Union[ChatRequest, AgentRequest, dict],
         **kwargs: Any,
     ) -> AsyncGenerator[Any, None]:
         # pylint: disable=too-many-branches
@@ -255,18 +285,16 @@ class AliasRunner(Runner):
                 "before calling 'stream_query'.",
             )
 
-        if isinstance(request, AgentRequest):
-            req_dict = request.model_dump()
-        elif isinstance(request, dict):
-            req_dict = request
-        else:
-            if hasattr(request, "model_dump"):
-                req_dict = request.model_dump()
-            else:
-                req_dict = dict(request)
+        # Requests are read field by field, so pydantic models are used as
+        # they are instead of being dumped to a dict first.
+        if not (isinstance(request, dict) or hasattr(request, "model_dump")):
+            request = dict(request)
+        field = self._field
 
-        request_id = req_dict.get("id") or str(uuid.uuid4())
-        session_id = req_dict.get("session_id") or f"session_{uuid.uuid4()}"
+        request_id = field(request, "id") or str(uuid.uuid4())
+        session_id = field(request, "session_id") or (
+            "session_" + secrets.token_hex(16)
+        )
         seq_gen = SequenceNumberGenerator()
 
         response = AgentResponse(id=request_id)
@@ -276,7 +304,10 @@ class AliasRunner(Runner):
         response.in_progress()
         yield seq_gen.yield_with_sequence(response)
 
-        user_text = self._extract_text_from_agent_request(req_dict)
+        if isinstance(request, ChatRequest):
+            user_text = request.query
+        else:
+            user_text = self._extract_text_from_agent_request(request)
         if not user_text:
             err = Error(
                 code="422",
@@ -285,14 +316,14 @@ class AliasRunner(Runner):
             yield seq_gen.yield_with_sequence(response.failed(err))
             return
 
-        raw_user_id = req_dict.get("user_id") or session_id
+        raw_user_id = field(request, "user_id") or session_id
         user_uuid = self._to_uuid(
             raw_user_id,
         ) or self._stable_uuid_from_string(
             str(raw_user_id),
         )
 
-        conversation_id = self._to_uuid(req_dict.get("conversation_id"))
+        conversation_id = self._to_uuid(field(request, "conversation_id"))
         if conversation_id is None:
             try:
                 conversation_id = await self._get_or_create_conversation_id(
@@ -307,18 +338,32 @@ class AliasRunner(Runner):
                 yield seq_gen.yield_with_sequence(response.failed(err))
                 return
 
-        task_id = self._to_uuid(req_dict.get("task_id")) or uuid.uuid4()
+        task_id = self._to_uuid(field(request, "task_id")) or uuid.uuid4()
 
         try:
-            req_chat_mode = req_dict.get("chat_mode") or self.default_chat_mode
-
-            chat_request_obj = ChatRequest.model_validate(
-                {
-                    "query": user_text,
-                    "chat_mode": req_chat_mode,
-                },
-            )
-        except ValidationError as exc:
+            if isinstance(request, ChatRequest):
+                # Already a validated model: forward it, only filling in the
+                # default chat mode like the dict path does.
+                chat_request_obj = request
+                if request.chat_mode is None:
+                    chat_request_obj = request.model_copy(
+                        update={
+                            "chat_mode": ChatMode(self.default_chat_mode),
+                        },
+                    )
+            else:
+                # Raw client input: validate it like any other request body.
+                req_chat_mode = (
+                    field(request, "chat_mode") or self.default_chat_mode
+                )
+                chat_request_obj = ChatRequest.model_validate(
+                    {
+                        "query": user_text,
+                        "chat_mode": req_chat_mode,
+                    },
+                )
+        except ValueError as exc:
+            # Covers pydantic's ValidationError and an invalid ChatMode.
             err = Error(
                 code="422",
                 message=f"ChatRequest validation failed: {exc}",
@@ -336,11 +381,15 @@ class AliasRunner(Runner):
             if asyncio.iscoroutine(result):
                 result = await result
 
+            completed = RunStatus.Completed
             async for event in adapt_alias_message_stream(result):
                 try:
+                    # The adapter only yields pydantic models, whose fields
+                    # live in the instance __dict__.
+                    fields = event.__dict__
                     if (
-                        getattr(event, "status", None) == RunStatus.Completed
-                        and getattr(event, "object", None) == "message"
+                        fields.get("status") == completed
+                        and fields.get("object") == "message"
                     ):
                         response.add_new_message(event)
                 except Exception:
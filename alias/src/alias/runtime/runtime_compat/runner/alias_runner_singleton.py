@@ -3,23 +3,30 @@ import asyncio
 from typing import Optional
 from alias.runtime.runtime_compat.runner.alias_runner import AliasRunner
 
-_lock: Optional[asyncio.Lock] = None
-_runner: Optional[AliasRunner] = None
+# The first caller schedules the start-up task; everyone else awaits the
+# same task, so no lock is needed and the warm path is a single await.
+_runner_task: Optional["asyncio.Task[AliasRunner]"] = None
 
 
-async def get_alias_runner() -> AliasRunner:
-    global _lock, _runner
+async def _start_alias_runner() -> AliasRunner:
+    runner = AliasRunner()
+    await runner.start()
+    return runner
+
 
-    if _runner is not None:
-        return _runner
+async def get_alias_runner() -> AliasRunner:
+    global _runner_task
 
-    if _lock is None:
-        _lock = asyncio.Lock()
+    task = _runner_task
+    if task is None:
+        task = asyncio.ensure_future(_start_alias_runner())
+        _runner_task = task
 
-    async with _lock:
-        if _runner is not None:
-            return _runner
-        runner = AliasRunner()
-        await runner.start()
-        _runner = runner
-        return _runner
+    try:
+        # Shield so a cancelled request does not cancel the shared start-up.
+        return await asyncio.shield(task)
+    except Exception:
+        # Let the next caller retry instead of caching the failure.
+        if task.done() and _runner_task is task:
+            _runner_task = None
+        raise
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=unused-argument
-import json
+import asyncio
 import uuid
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Optional
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
@@ -10,6 +10,7 @@ from loguru import logger
 from starlette.types import Receive
 
 from alias.server.api.deps import CurrentUser
+from alias.server.core.config import settings
 from alias.server.exceptions.base import BaseError
 from alias.server.schemas.chat import (
     ChatRequest,
@@ -17,11 +18,22 @@ from alias.server.schemas.chat import (
     StopChatResponse,
 )
 from alias.server.services.chat_service import ChatService
+from alias.server.utils.json_utils import json_dumps_bytes
 from alias.server.utils.request_context import request_context_var
 from alias.runtime.runtime_compat.runner.alias_runner import AliasRunner
+from alias.runtime.runtime_compat.runner.alias_runner_singleton import (
+    get_alias_runner,
+)
 
 router = APIRouter(prefix="/conversations", tags=["conversations/chat"])
 
+_chat_service = ChatService()
+
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# Upper bound on a coalesced write, so a fast stream still flushes steadily.
+_SSE_COALESCE_MAX_BYTES = 64 * 1024
+
 
 class EnhancedStreamingResponse(StreamingResponse):
     """
@@ -48,40 +60,39 @@ class EnhancedStreamingResponse(StreamingResponse):
                     f"Chat stopped by disconnect from client: "
                     f"task_id={self.task_id}",
                 )
-                service = ChatService()
-                await service.stop_chat(
+                await _chat_service.stop_chat(
                     user_id=self.user_id,
                     task_id=self.task_id,
                 )
                 break
 
 
-def _to_raw_sse_event(data: Any) -> str:
+def _to_raw_sse_event(data: Any) -> bytes:
     """
     Convert a chunk from runner.stream_query_native into
-    a raw SSE event string.
+    a raw SSE event, already UTF-8 encoded.
     """
     if data == "[DONE]":
-        return "data: [DONE]\n\n"
+        return _SSE_DONE
 
     if hasattr(data, "model_dump"):
         data = data.model_dump()
 
-    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return b"data: " + json_dumps_bytes(data) + b"\n\n"
 
 
 async def event_generator(
     runner: AliasRunner,
-    request_dict: dict,
+    chat_request: ChatRequest,
     **runner_kwargs: Any,
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """
     Convert AliasRunner.stream_query_native output into
-    a raw SSE string stream.
+    a raw SSE byte stream.
     """
     try:
         async for chunk in runner.stream_query_native(
-            request_dict,
+            chat_request,
             **runner_kwargs,
         ):
             yield _to_raw_sse_event(chunk)
@@ -96,6 +107,76 @@ async def event_generator(
         yield _to_raw_sse_event("[DONE]")
 
 
+async def _next_sse_event(
+    events: AsyncIterator[bytes],
+    pending: Optional["asyncio.Future[bytes]"],
+) -> Optional[bytes]:
+    """
+    Await the next frame, from `pending` if one is already in flight.
+    Returns None once the source is exhausted.
+    """
+    try:
+        if pending is None:
+            # Nothing to flush on a timer: read the source directly.
+            return await events.__anext__()
+        return await pending
+    except StopAsyncIteration:
+        return None
+
+
+async def coalesce_sse_events(
+    events: AsyncIterator[bytes],
+    window: float,
+) -> AsyncIterator[bytes]:
+    """
+    Merge SSE frames that arrive within `window` seconds of the first
+    buffered frame into a single write. `[DONE]` is flushed immediately.
+    Only worth wrapping a stream in when `window` is positive.
+    """
+    loop = asyncio.get_running_loop()
+    buffer = bytearray()
+    flush_at = 0.0
+    pending: Optional["asyncio.Future[bytes]"] = None
+    try:
+        while True:
+            if buffer:
+                if pending is None:
+                    # Drive the source through a future so a timed-out
+                    # wait does not cancel the generator mid-step.
+                    pending = asyncio.ensure_future(events.__anext__())
+                done, _ = await asyncio.wait(
+                    {pending},
+                    timeout=max(flush_at - loop.time(), 0),
+                )
+                if not done:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+            step, pending = pending, None
+            event = await _next_sse_event(events, step)
+            if event is None:
+                break
+
+            if not buffer:
+                flush_at = loop.time() + window
+            buffer += event
+            if event == _SSE_DONE or len(buffer) >= _SSE_COALESCE_MAX_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+    except Exception:
+        # Deliver what was already produced before surfacing the error.
+        if buffer:
+            yield bytes(buffer)
+            buffer.clear()
+        raise
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+    if buffer:
+        yield bytes(buffer)
+
+
 @router.post("/{conversation_id}/chat")
 async def chat(
     current_user: CurrentUser,
@@ -108,22 +189,24 @@ async def chat(
     task_id = uuid.UUID(request_id) if request_id else uuid.uuid4()
     user_id = current_user.id
 
-    from alias.runtime.runtime_compat.runner.alias_runner_singleton import (
-        get_alias_runner,
-    )
-
     runner = await get_alias_runner()
 
-    request_dict = chat_request.model_dump()
+    events = event_generator(
+        runner,
+        chat_request,
+        pre_validated=True,
+        user_id=user_id,
+        conversation_id=conversation_id,
+        task_id=task_id,
+    )
+    if settings.SSE_COALESCE_MS > 0:
+        events = coalesce_sse_events(
+            events,
+            window=settings.SSE_COALESCE_MS / 1000,
+        )
 
     return EnhancedStreamingResponse(
-        event_generator(
-            runner,
-            request_dict,
-            user_id=user_id,
-            conversation_id=conversation_id,
-            task_id=task_id,
-        ),
+        events,
         media_type="text/event-stream",
         user_id=user_id,
         task_id=task_id,
@@ -139,8 +222,7 @@ async def stop_chat(
     conversation_id: uuid.UUID,
     task_id: uuid.UUID,
 ) -> StopChatResponse:
-    service = ChatService()
-    await service.stop_chat(
+    await _chat_service.stop_chat(
         user_id=current_user.id,
         task_id=task_id,
     )
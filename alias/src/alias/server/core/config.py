@@ -108,6 +108,13 @@ class ServerConfig(BaseSettings):
         default=10,
         description="Heartbeat interval (seconds)",
     )
+    SSE_COALESCE_MS: int = Field(
+        default=0,
+        description=(
+            "Window for merging chat SSE frames into one write "
+            "(milliseconds, 0 disables)"
+        ),
+    )
 
 
 class DatabaseConfig(BaseSettings):
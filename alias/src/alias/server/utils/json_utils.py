@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson turns integers outside the 64-bit range into floats; any run of
+# 19+ digits might be one, so such documents go through json instead.
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+def _stdlib_dumps_bytes(val: Any) -> bytes:
+    # Compact separators so the output matches orjson byte for byte.
+    return json.dumps(val, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8",
+    )
+
+
+if orjson is not None:
+
+    def json_loads(content: str) -> Any:
+        if _LONG_DIGITS.search(content):
+            return json.loads(content)
+        return orjson.loads(content)
+
+    def json_dumps_bytes(val: Any) -> bytes:
+        try:
+            return orjson.dumps(val, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which json still serializes.
+            return _stdlib_dumps_bytes(val)
+
+else:
+    json_loads = json.loads
+    json_dumps_bytes = _stdlib_dumps_bytes
+
+
+def json_dumps(val: Any) -> str:
+    """Serialize `val` to a compact UTF-8 JSON string."""
+    return json_dumps_bytes(val).decode("utf-8")